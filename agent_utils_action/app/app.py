@@ -1,9 +1,12 @@
 """This module provides the Streamlit application for managing agent utilities."""
 
+import hashlib
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import streamlit as st
 import yaml
@@ -15,16 +18,36 @@ from jvclient.lib.utils import (
     get_reports_payload,
 )
 from jvclient.lib.widgets import app_controls, app_header
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from streamlit_router import StreamlitRouter
 
+# seconds cached panel data stays fresh between reruns
+CACHE_TTL = 30.0
+
+# seconds on-demand results (healthcheck, profile, interactions) stay on screen
+RESULT_TTL = 300.0
+
+# parsed uploads kept per session
+PARSED_DOCUMENTS_LIMIT = 4
+
+# cached entries derived from agent memory, dropped after any memory mutation
+MEMORY_CACHE_KEYS = ("healthcheck:", "interactions", "memory_profile")
+
 
 def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -> None:
     """Render the Streamlit application for managing agent utilities."""
     # Add application header controls
     (model_key, module_root) = app_header(agent_id, action_id, info)
 
-    # initialise the agent object by fetching the agent based on agent_id
-    agent_details = call_get_agent(agent_id)
+    # fetch the agent and its logging state together; both are cached between reruns
+    panels = load_panels(
+        model_key,
+        {
+            "agent": lambda: call_get_agent(agent_id),
+            "logging": lambda: call_walker(agent_id, "get_logging"),
+        },
+    )
+    agent_details = panels["agent"] or {}
 
     with st.expander("Agent Configuration", False):
 
@@ -47,6 +70,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
 
             # Call the function to update the agent configuration
             if result := call_update_agent(agent_id, agent_data):
+                invalidate(model_key, "agent")
                 st.success("Agent updated successfully")
             else:
                 st.error("Failed to update agent.")
@@ -84,24 +108,150 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         if st.button("Run Healthcheck", key=f"{model_key}_btn_healthcheck"):
 
             # Call the function for healthcheck
-            result = call_api(
-                endpoint="action/walker/agent_utils_action/memory_healthcheck",
-                json_data={"agent_id": agent_id, "session_id": session_id},
-            )
+            if (
+                result := call_walker(
+                    agent_id, "memory_healthcheck", {"session_id": session_id}
+                )
+            ) is None:
+                st.error(
+                    "Failed to run memory healthcheck. Please check your inputs and try again."
+                )
+            elif "error" in result:
+                st.error(result["error"])
+            else:
+                cache_set(model_key, f"healthcheck:{session_id}", result)
 
-            # Display results
-            if result and result.status_code == 200:
-                result = get_reports_payload(result)
-                st.success("Memory healthcheck completed successfully!")
+        # Display the last result for this session until it expires or memory changes
+        if (
+            result := cache_get(model_key, f"healthcheck:{session_id}", RESULT_TTL)
+        ) is not None:
+            st.success("Memory healthcheck completed successfully!")
+
+            # Dynamically display key-value pairs
+            for key, value in result.items():
+                st.write(f"**{key}:** {value}")
 
-                # Dynamically display key-value pairs
-                for key, value in result.items():
-                    st.write(f"**{key}:** {value}")
+    with st.expander("Memory Profile", False):
+        col1, col2 = st.columns(2)
+        with col1:
+            session_id = st.text_input(
+                "Session ID (optional)", value="", key=f"{model_key}_profile_session_id"
+            )
+        with col2:
+            top_k = st.number_input(
+                "Top K",
+                min_value=1,
+                value=10,
+                key=f"{model_key}_profile_top_k",
+                help="Number of largest sessions, frames and interactions to list",
+            )
+
+        if st.button("Run Profile", key=f"{model_key}_btn_memory_profile"):
+            if (
+                result := call_walker(
+                    agent_id,
+                    "memory_profile",
+                    {"session_id": session_id, "top_k": top_k},
+                    timeout=120,
+                )
+            ) is None:
+                st.error("Failed to profile memory.")
+            elif "error" in result:
+                st.error(result["error"])
             else:
-                st.error(
-                    "Failed to run memory healthcheck. Please check your inputs and try again."
+                cache_set(model_key, "memory_profile", result)
+
+        if profile := cache_get(model_key, "memory_profile", RESULT_TTL):
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total Size", format_bytes(profile.get("total_bytes", 0)))
+            col2.metric("Sessions", profile.get("sessions", 0))
+            col3.metric("Interactions", profile.get("interactions", 0))
+
+            st.write("**Largest Sessions**")
+            st.dataframe(profile.get("top_sessions", []), use_container_width=True)
+            st.write("**Largest Frames**")
+            st.dataframe(profile.get("top_frames", []), use_container_width=True)
+            st.write("**Largest Interactions**")
+            st.dataframe(profile.get("top_interactions", []), use_container_width=True)
+            st.write("**Interaction Fields**")
+            st.dataframe(profile.get("fields", []), use_container_width=True)
+            st.write("**Collections**")
+            st.dataframe(profile.get("collections", []), use_container_width=True)
+
+            if top_sessions := profile.get("top_sessions", []):
+                st.write("---")
+                selected_session = st.selectbox(
+                    "Session",
+                    options=[item["session_id"] for item in top_sessions],
+                    key=f"{model_key}_profile_selected_session",
                 )
 
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button(
+                        "Compact Session", key=f"{model_key}_btn_profile_refresh"
+                    ):
+                        if call_api(
+                            endpoint="action/walker/agent_utils_action/refresh_memory",
+                            json_data={
+                                "agent_id": agent_id,
+                                "session_id": selected_session,
+                            },
+                        ):
+                            st.success(f"Session {selected_session} compacted")
+                            invalidate(model_key, *MEMORY_CACHE_KEYS)
+                        else:
+                            st.error("Failed to compact session.")
+                with col2:
+                    # Step 1: Trigger confirmation for the selected session
+                    if st.button("Purge Session", key=f"{model_key}_btn_profile_purge"):
+                        st.session_state.confirm_profile_purge = selected_session
+                        st.session_state.profile_purge_result = None
+
+        # Step 2: Handle confirmation prompt
+        if purge_session := st.session_state.get("confirm_profile_purge"):
+            st.warning(
+                f"Are you sure you want to purge session {purge_session}? This action cannot be undone.",
+                icon="⚠️",
+            )
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if st.button(
+                    "Yes, Purge Session", key=f"{model_key}_btn_profile_purge_yes"
+                ):
+                    # the walker reports False when there was nothing to purge
+                    result = call_walker(
+                        agent_id, "purge_frame_memory", {"session_id": purge_session}
+                    )
+                    if result is True:
+                        invalidate(model_key, *MEMORY_CACHE_KEYS)
+                    st.session_state.profile_purge_result = result is True
+                    st.session_state.confirm_profile_purge = None
+
+            with col2:
+                if st.button(
+                    "No, Keep Session", key=f"{model_key}_btn_profile_purge_no"
+                ):
+                    st.session_state.confirm_profile_purge = None
+                    st.session_state.profile_purge_result = None
+                    st.rerun()
+
+        # Step 3: Show result *outside* confirmation
+        profile_purge_result = st.session_state.get("profile_purge_result")
+        if profile_purge_result is True:
+            st.success("Session purged successfully")
+            st.session_state.profile_purge_result = None  # Reset after showing
+            time.sleep(2)
+            st.rerun()
+        elif profile_purge_result is False:
+            st.error(
+                "Failed to purge session. Ensure that the session still exists or check functionality"
+            )
+            st.session_state.profile_purge_result = None  # Reset after showing
+            time.sleep(2)
+            st.rerun()
+
     with st.expander("Purge Frame Memory", False):
         session_id = st.text_input(
             "Session ID (optional)", value="", key=f"{model_key}_purge_frame_session_id"
@@ -127,6 +277,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                         json_data={"agent_id": agent_id, "session_id": session_id},
                     )
                     if purge_frame_result and purge_frame_result.status_code == 200:
+                        invalidate(model_key, *MEMORY_CACHE_KEYS)
                         st.session_state.purge_frame_result = True
                         st.session_state.confirm_purge_frame = False
 
@@ -173,20 +324,19 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
 
             with col1:
                 if st.button("Yes, Purge Collection"):
-                    purge_collection_result = call_api(
-                        endpoint="action/walker/agent_utils_action/purge_collection_memory",
-                        json_data={
-                            "agent_id": agent_id,
-                            "collection_name": collection_name,
-                        },
+                    purge_collection_result = call_walker(
+                        agent_id,
+                        "purge_collection_memory",
+                        {"collection_name": collection_name},
                         timeout=60,
                     )
 
-                    if (
-                        purge_collection_result
-                        and purge_collection_result.status_code == 200
-                    ):
-                        st.session_state.purge_collection_result = True
+                    if purge_collection_result is not None:
+                        if purge_collection_result is True:
+                            invalidate(model_key, *MEMORY_CACHE_KEYS)
+                        st.session_state.purge_collection_result = (
+                            purge_collection_result
+                        )
                         st.session_state.confirm_purge_collection = False
 
             with col2:
@@ -202,6 +352,12 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
             st.session_state.purge_collection_result = None
             time.sleep(2)
             st.rerun()
+        elif (
+            isinstance(purge_collection_result, dict)
+            and "error" in purge_collection_result
+        ):
+            st.error(purge_collection_result["error"])
+            st.session_state.purge_collection_result = None
         elif purge_collection_result is False:
             st.error(
                 "Failed to purge collection memory. Ensure that there is something to purge or check functionality"
@@ -211,13 +367,9 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
             st.rerun()
 
     with st.expander("Logging", False):
-        _logging = call_api(
-            endpoint="action/walker/agent_utils_action/get_logging",
-            json_data={"agent_id": agent_id},
-        )
+        _logging = panels["logging"]
 
-        if _logging and _logging.status_code == 200:
-            _logging = get_reports_payload(_logging)
+        if _logging is not None:
             logging = st.checkbox(
                 "Log Interactions", value=_logging, key=f"{model_key}_logging"
             )
@@ -227,6 +379,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                     endpoint="action/walker/agent_utils_action/set_logging",
                     json_data={"agent_id": agent_id, "agent_logging": logging},
                 ):
+                    invalidate(model_key, "logging")
                     st.success("Agent logging config updated")
                 else:
                     st.error(
@@ -246,6 +399,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                 endpoint="action/walker/agent_utils_action/refresh_memory",
                 json_data={"agent_id": agent_id, "session_id": session_id},
             ):
+                invalidate(model_key, *MEMORY_CACHE_KEYS)
                 st.success("Agent memory refreshed successfully")
             else:
                 st.error(
@@ -285,31 +439,27 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         if st.button("Import", key=f"{model_key}_btn_import_memory"):
             try:
                 if memory_source == "Upload file" and uploaded_file:
-                    file_content = uploaded_file.read().decode("utf-8")
-                    if uploaded_file.type == "application/json":
-                        data_to_import = json.loads(file_content)
-                    else:
-                        data_to_import = yaml.safe_load(file_content)
+                    data_to_import = parse_document(model_key, uploaded_file.getvalue())
 
-                elif memory_source == "Text input" and raw_text_input.strip():
-                    # Try JSON first, fall back to YAML
-                    try:
-                        data_to_import = json.loads(raw_text_input)
-                    except json.JSONDecodeError:
-                        data_to_import = yaml.safe_load(raw_text_input)
+                elif memory_source == "Text input":
+                    data_to_import = parse_document(model_key, raw_text_input)
 
                 if data_to_import is None:
                     st.error("No valid memory data provided.")
                 else:
 
-                    if result := call_api(
-                        endpoint="action/walker/agent_utils_action/import_memory",
-                        json_data={
-                            "agent_id": agent_id,
+                    result = call_walker(
+                        agent_id,
+                        "import_memory",
+                        {
                             "data": json.dumps(data_to_import),
                             "overwrite": overwrite,
                         },
-                    ):
+                    )
+                    if isinstance(result, dict) and "error" in result:
+                        st.error(result["error"])
+                    elif result is True:
+                        invalidate(model_key, *MEMORY_CACHE_KEYS)
                         st.success("Agent memory imported successfully")
                     else:
                         st.error(
@@ -381,6 +531,8 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                             key="download_yaml",
                         )
 
+                elif isinstance(result, dict) and "error" in result:
+                    st.error(result["error"])
                 else:
                     st.error(
                         "Failed to export agent memory. Please check your inputs and try again."
@@ -401,6 +553,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         if st.button("Import", key=f"{model_key}_btn_import_agent"):
             # Call the function to import
             if result := call_import_agent(descriptor=agent_descriptor):
+                invalidate(model_key, "agent")
                 st.success("Agent imported successfully")
             else:
                 st.error(
@@ -411,12 +564,17 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
 
         if uploaded_file is not None:
             st.write(uploaded_file)
-            if result := call_import_agent(descriptor=uploaded_file):
-                st.success("Agent imported successfully")
-            else:
-                st.error(
-                    "Failed to import agent. Ensure that you are uploading a valid YAML file"
-                )
+            # import each uploaded file once rather than on every rerun
+            digest = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+            if st.session_state.get(f"{model_key}_imported_descriptor") != digest:
+                if result := call_import_agent(descriptor=uploaded_file):
+                    st.session_state[f"{model_key}_imported_descriptor"] = digest
+                    invalidate(model_key, "agent")
+                    st.success("Agent imported successfully")
+                else:
+                    st.error(
+                        "Failed to import agent. Ensure that you are uploading a valid YAML file"
+                    )
 
     with st.expander("Import DAF", False):
         # Initialize lists to store classified data
@@ -448,38 +606,40 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
 
         purge = st.toggle("Purge", value=True, key=f"{model_key}_purge_daf")
 
-        if daf_source == "Upload file" and uploaded_file:
-            file_content = uploaded_file.read().decode("utf-8")
-            if uploaded_file.type == "application/json":
-                data_to_import = json.loads(file_content)
-            else:
-                data_to_import = yaml.safe_load(file_content)
+        if st.button("Import", key=f"{model_key}_btn_importing_daf"):
 
-        elif daf_source == "Text input" and raw_text_input.strip():
-            # Try JSON first, fall back to YAML
             try:
-                data_to_import = json.loads(raw_text_input)
-            except json.JSONDecodeError:
-                data_to_import = yaml.safe_load(raw_text_input)
+                # parsed once per upload, and only when importing
+                if daf_source == "Upload file" and uploaded_file:
+                    data_to_import = parse_document(model_key, uploaded_file.getvalue())
 
-        if st.button("Import", key=f"{model_key}_btn_importing_daf"):
+                elif daf_source == "Text input":
+                    data_to_import = parse_document(model_key, raw_text_input)
 
-            if data_to_import is None:
-                st.error("Not valid daf provided.")
-            else:
-                response = call_api(
-                    endpoint="action/walker/agent_utils_action/import_agent",
-                    json_data={
-                        "agent_id": agent_id,
-                        "data": json.dumps(data_to_import),
-                        "purge": purge,
-                    },
-                    timeout=120,
-                )
-                if response is not None and response.status_code == 200:
-                    st.success("Daf imported successfully")
+                if data_to_import is None:
+                    st.error("Not valid daf provided.")
                 else:
-                    st.error("Failed to import DAF.")
+                    response = call_api(
+                        endpoint="action/walker/agent_utils_action/import_agent",
+                        json_data={
+                            "agent_id": agent_id,
+                            "data": json.dumps(data_to_import),
+                            "purge": purge,
+                        },
+                        timeout=120,
+                    )
+                    if response is None or response.status_code != 200:
+                        st.error("Failed to import DAF.")
+                    elif (
+                        isinstance(import_result := get_reports_payload(response), dict)
+                        and "error" in import_result
+                    ):
+                        st.error(import_result["error"])
+                    else:
+                        invalidate(model_key, "agent", *MEMORY_CACHE_KEYS)
+                        st.success("Daf imported successfully")
+            except Exception as e:
+                st.error(f"Import failed: {e}")
 
     with st.expander("Export DAF", False):
 
@@ -529,9 +689,15 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                     "reporting": True,
                 },
             )
-            if response is not None and response.status_code == 200:
+            if response is None or response.status_code != 200:
+                st.error("Failed to export DAF.")
+            elif (
+                isinstance(daf_result := get_reports_payload(response), dict)
+                and "error" in daf_result
+            ):
+                st.error(daf_result["error"])
+            else:
                 st.success("DAF exported successfully")
-                daf_result = get_reports_payload(response)
                 st.download_button(
                     label="Download DAF",
                     data=json.dumps(daf_result, indent=2),
@@ -540,9 +706,6 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                 )
                 st.json(daf_result)
 
-            else:
-                st.error("Failed to export DAF.")
-
     with st.expander("Delete Agent", False):
         if st.button(
             "Delete Agent", key=f"{model_key}_btn_delete_agent", disabled=(not agent_id)
@@ -552,6 +715,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                 endpoint="action/walker/agent_utils_action/delete_agent",
                 json_data={"agent_id": agent_id},
             ):
+                invalidate(model_key, "agent", "logging", *MEMORY_CACHE_KEYS)
                 st.success("Agent deleted successfully")
             else:
                 st.error(
@@ -599,13 +763,13 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                     if result and result.status_code == 200:
                         interactions = get_reports_payload(result)
 
-                        st.session_state["last_interactions"] = interactions
+                        cache_set(model_key, "interactions", interactions)
                 except Exception as e:
                     st.error(f"Failed to fetch interactions: {str(e)}")
                     interactions = []
 
         # Display results
-        interactions = st.session_state.get("last_interactions", [])
+        interactions = cache_get(model_key, "interactions", RESULT_TTL) or []
 
         if not interactions:
             st.info(
@@ -759,3 +923,149 @@ def classify_data(data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> str:
                 elif "frame" in item:
                     return "memory"
     return "unknown"
+
+
+def format_bytes(size: int) -> str:
+    """
+    Formats a byte count for display.
+
+    Args:
+        size (int): The number of bytes.
+
+    Returns:
+        str: The size in the largest fitting unit, e.g. "1.5 MB".
+    """
+
+    value = float(size)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if value < 1024 or unit == "GB":
+            break
+        value /= 1024
+    return f"{value:.1f} {unit}"
+
+
+def load_panels(
+    model_key: str, fetchers: Dict[str, Callable[[], Any]], ttl: float = CACHE_TTL
+) -> Dict[str, Any]:
+    """
+    Returns cached panel data, fetching any missing or expired entries concurrently.
+
+    Args:
+        model_key (str): The key namespacing this app's session state.
+        fetchers (Dict[str, Callable[[], Any]]): Cache key to the call that fetches its data.
+        ttl (float): Seconds a fetched value stays fresh.
+
+    Returns:
+        Dict[str, Any]: Cache key to data; None where the fetch failed.
+    """
+
+    cache = st.session_state.setdefault(f"{model_key}_cache", {})
+    now = time.time()
+    stale = [key for key in fetchers if key not in cache or cache[key][0] + ttl < now]
+
+    if stale:
+        # call_api reads the session's credentials, so workers need the script context
+        ctx = get_script_run_ctx()
+
+        def run(fetch: Callable[[], Any]) -> Any:
+            add_script_run_ctx(threading.current_thread(), ctx)
+            return fetch()
+
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            results = dict(
+                zip(stale, executor.map(run, [fetchers[key] for key in stale]))
+            )
+
+        for key, value in results.items():
+            # failures are not cached so the next rerun retries them
+            if value is None:
+                cache.pop(key, None)
+            else:
+                cache[key] = (now, value)
+
+    return {key: cache[key][1] if key in cache else None for key in fetchers}
+
+
+def cache_get(model_key: str, key: str, ttl: float = CACHE_TTL) -> Any:
+    """Returns a cached value if it is still fresh, otherwise None."""
+
+    cache = st.session_state.setdefault(f"{model_key}_cache", {})
+    if key in cache and cache[key][0] + ttl >= time.time():
+        return cache[key][1]
+    return None
+
+
+def cache_set(model_key: str, key: str, value: Any) -> None:
+    """Stores a value in the cache."""
+
+    st.session_state.setdefault(f"{model_key}_cache", {})[key] = (time.time(), value)
+
+
+def invalidate(model_key: str, *keys: str) -> None:
+    """
+    Drops cached entries after a mutation so the next rerun refetches them.
+
+    Args:
+        model_key (str): The key namespacing this app's session state.
+        *keys (str): Cache keys, or prefixes ending in ":", to drop.
+    """
+
+    cache = st.session_state.setdefault(f"{model_key}_cache", {})
+    for cached_key in list(cache):
+        for key in keys:
+            if cached_key == key or (key.endswith(":") and cached_key.startswith(key)):
+                del cache[cached_key]
+                break
+
+
+def call_walker(
+    agent_id: str,
+    walker: str,
+    payload: Optional[dict] = None,
+    timeout: Optional[int] = None,
+) -> Any:
+    """Calls an agent_utils_action walker and returns its report payload, or None on failure."""
+
+    kwargs = {"timeout": timeout} if timeout else {}
+    result = call_api(
+        endpoint=f"action/walker/agent_utils_action/{walker}",
+        json_data={"agent_id": agent_id, **(payload or {})},
+        **kwargs,
+    )
+    if result and result.status_code == 200:
+        return get_reports_payload(result)
+    return None
+
+
+def parse_document(model_key: str, content: Union[str, bytes]) -> Any:
+    """
+    Parses YAML or JSON content once per content hash.
+
+    Args:
+        model_key (str): The key namespacing this app's session state.
+        content (Union[str, bytes]): Raw text or uploaded file bytes.
+
+    Returns:
+        Any: The parsed document, or None if there is nothing to parse.
+    """
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    if not content.strip():
+        return None
+
+    parsed = st.session_state.setdefault(f"{model_key}_parsed_documents", {})
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    if digest not in parsed:
+        # bound the documents held in session state
+        if len(parsed) >= PARSED_DOCUMENTS_LIMIT:
+            parsed.pop(next(iter(parsed)))
+
+        # Try JSON first, fall back to YAML
+        try:
+            parsed[digest] = json.loads(content)
+        except json.JSONDecodeError:
+            parsed[digest] = yaml.safe_load(content)
+
+    return parsed[digest]
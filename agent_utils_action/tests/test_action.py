@@ -9,31 +9,26 @@ class TestAgentUtilsAction:
     def test_agent_utils_action(self) -> None:
         """Test AgentUtilsAction."""
 
-        from jaclang import jac_import
-        from jaclang.runtimelib.context import ExecutionContext
+        from jaclang.runtimelib.machine import ExecutionContext
+        from jaclang.runtimelib.machine import JacMachine as Jac
+
+        # load the action as a package, as jivas does, so its relative imports resolve
+        package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        base, package = os.path.split(package_dir)
 
         os.environ["JACPATH"] = "./"
 
         # load the JAC application
-        jctx = ExecutionContext.create()
-
-        filename = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "agent_utils_action.jac",
-        )
-
-        base, mod = os.path.split(filename)
-        base = base if base else "./"
-        mod = mod[:-4]
-
-        jac_import(
-            target=mod,
-            base_path=base,
-            cachable=True,
-            override_name="__main__",
-        )
-
-        jctx.close()
-
-        del os.environ["JACPATH"]
+        Jac.set_base_path(base)
+        jctx = ExecutionContext()
+        Jac.set_context(jctx)
+
+        try:
+            Jac.jac_import(
+                target=f"{package}.agent_utils_action",
+                base_path=base,
+            )
+        finally:
+            jctx.close()
+
+            del os.environ["JACPATH"]
@@ -0,0 +1,270 @@
+"""Tests for AdmissionControl."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, cast
+
+
+@contextmanager
+def admission_control() -> Iterator[Any]:
+    """Load AdmissionControl and reset its process-wide state afterwards."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    base, package = os.path.split(package_dir)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    try:
+        module = cast(
+            Any,
+            Jac.jac_import(target=f"{package}.admission_control", base_path=base)[0],
+        )
+        control = module.AdmissionControl
+        try:
+            yield control
+        finally:
+            control.active.clear()
+            control.queued.clear()
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+
+class Acquirer(threading.Thread):
+    """Acquires on its own thread, which holds no tickets, and keeps the result."""
+
+    def __init__(self, control: Any, **kwargs: Any) -> None:
+        """Start acquiring."""
+        super().__init__()
+        self.control = control
+        self.kwargs = kwargs
+        self.ticket = ""
+        self.start()
+
+    def run(self) -> None:
+        """Acquire a ticket."""
+        self.ticket = self.control.acquire(**self.kwargs)
+
+
+def wait_for_queued(control: Any, count: int) -> None:
+    """Wait until count operations are queued."""
+
+    deadline = time.time() + 2
+    while len(control.snapshot()["queued"]) < count:
+        assert time.time() < deadline, "operations were not queued"
+        time.sleep(0.01)
+
+
+class TestAdmissionControl:
+    """Tests for AdmissionControl."""
+
+    def test_nested_ticket_reuse(self) -> None:
+        """Nested operations on the same thread share the outer ticket until fully released."""
+
+        with admission_control() as control:
+            outer = control.acquire(agent_id="a", operation="import_daf")
+            inner = control.acquire(agent_id="a", operation="import_memory")
+
+            assert outer and inner == outer
+            assert control.active[outer]["depth"] == 2
+
+            control.release(inner)
+            assert outer in control.active
+            assert control.active[outer]["depth"] == 1
+
+            control.release(outer)
+            assert outer not in control.active
+
+            # the thread no longer holds a ticket, so the next operation gets a fresh one
+            again = control.acquire(agent_id="a", operation="export_memory")
+            assert again and again != outer
+            control.release(again)
+
+    def test_agent_cap(self) -> None:
+        """A second operation on a busy agent is turned away while other agents still run."""
+
+        with admission_control() as control:
+            ticket = control.acquire(agent_id="a", operation="export_memory")
+
+            same_agent = Acquirer(
+                control, agent_id="a", operation="export_memory", timeout=0
+            )
+            other_agent = Acquirer(
+                control, agent_id="b", operation="export_memory", timeout=0
+            )
+            same_agent.join()
+            other_agent.join()
+
+            assert same_agent.ticket == ""
+            assert other_agent.ticket
+
+            control.release(other_agent.ticket)
+            control.release(ticket)
+
+    def test_process_cap(self) -> None:
+        """No more than max_process_operations run at once across agents."""
+
+        with admission_control() as control:
+            first = control.acquire(
+                agent_id="a", operation="export_memory", max_process_operations=2
+            )
+            second = Acquirer(
+                control,
+                agent_id="b",
+                operation="export_memory",
+                max_process_operations=2,
+                timeout=0,
+            )
+            second.join()
+            third = Acquirer(
+                control,
+                agent_id="c",
+                operation="export_memory",
+                max_process_operations=2,
+                timeout=0,
+            )
+            third.join()
+
+            assert first and second.ticket
+            assert third.ticket == ""
+
+            control.release(second.ticket)
+            control.release(first)
+
+    def test_timeout(self) -> None:
+        """A queued operation gives up after its timeout and leaves the queue."""
+
+        with admission_control() as control:
+            ticket = control.acquire(agent_id="a", operation="export_memory")
+
+            start = time.time()
+            waiter = Acquirer(
+                control, agent_id="a", operation="export_memory", timeout=0.2
+            )
+            waiter.join()
+
+            assert waiter.ticket == ""
+            assert time.time() - start >= 0.2
+            assert not control.queued
+
+            control.release(ticket)
+
+    def test_queue_full(self) -> None:
+        """Once the queue is full further operations are rejected without waiting."""
+
+        with admission_control() as control:
+            ticket = control.acquire(agent_id="a", operation="export_memory")
+
+            waiter = Acquirer(
+                control,
+                agent_id="a",
+                operation="export_memory",
+                max_queued=1,
+                timeout=2,
+            )
+            wait_for_queued(control, 1)
+
+            start = time.time()
+            rejected = Acquirer(
+                control,
+                agent_id="a",
+                operation="export_memory",
+                max_queued=1,
+                timeout=2,
+            )
+            rejected.join()
+            assert rejected.ticket == ""
+            assert time.time() - start < 1
+
+            # releasing the slot admits the queued operation
+            control.release(ticket)
+            waiter.join()
+            assert waiter.ticket
+            control.release(waiter.ticket)
+
+    def test_arrival_order(self) -> None:
+        """Waiters are admitted in arrival order across agents."""
+
+        with admission_control() as control:
+            ticket = control.acquire(
+                agent_id="a", operation="export_memory", max_process_operations=1
+            )
+
+            admitted: list = []
+            lock = threading.Lock()
+
+            def wait(agent_id: str) -> None:
+                waiter_ticket = control.acquire(
+                    agent_id=agent_id,
+                    operation="export_memory",
+                    max_process_operations=1,
+                    timeout=2,
+                )
+                with lock:
+                    admitted.append(agent_id)
+                time.sleep(0.05)
+                control.release(waiter_ticket)
+
+            threads = []
+            for count, agent_id in enumerate(["b", "c", "d"], start=1):
+                thread = threading.Thread(target=wait, args=(agent_id,))
+                thread.start()
+                threads.append(thread)
+                wait_for_queued(control, count)
+
+            control.release(ticket)
+            for thread in threads:
+                thread.join()
+
+            assert admitted == ["b", "c", "d"]
+
+    def test_checkpoint_pacing(self) -> None:
+        """Checkpoints hold an operation to its rows per second budget."""
+
+        with admission_control() as control:
+            ticket = control.acquire(
+                agent_id="a",
+                operation="export_memory",
+                batch_size=10,
+                rows_per_second=100,
+            )
+
+            start = time.time()
+            for _ in range(3):
+                control.checkpoint(ticket, rows=10, data={"frame": "x"})
+            elapsed = time.time() - start
+
+            entry = control.active[ticket]
+            assert entry["rows"] == 30
+            # bytes are only measured when a bytes budget is set
+            assert entry["bytes"] == 0
+            assert elapsed >= 0.25
+
+            control.release(ticket)
+
+    def test_checkpoint_bytes(self) -> None:
+        """Checkpoints measure each chunk when a bytes budget is set."""
+
+        with admission_control() as control:
+            ticket = control.acquire(
+                agent_id="a",
+                operation="export_memory",
+                yield_interval=0,
+                bytes_per_second=10_000_000,
+            )
+
+            control.checkpoint(ticket, rows=2, data=[{"a": 1}, {"b": 2}])
+
+            assert control.active[ticket]["bytes"] == len('[{"a": 1}, {"b": 2}]')
+
+            control.release(ticket)
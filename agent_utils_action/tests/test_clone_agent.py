@@ -0,0 +1,125 @@
+"""Tests for cloning an agent."""
+
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Iterator, cast
+
+VECTOR_STORE = "jivas/typesense_vector_store_action"
+
+DESCRIPTOR: dict = {
+    "id": "n:Agent:1",
+    "name": "support",
+    "descriptor": "daf/support/descriptor.yaml",
+    "actions": [
+        {
+            "action": "jivas/intro_interact_action",
+            "context": {"id": "n:Action:1", "enabled": True},
+        },
+        {
+            "action": VECTOR_STORE,
+            "context": {"id": "n:Action:2", "collection_name": "support_kb"},
+        },
+    ],
+}
+
+
+@contextmanager
+def agent_utils_action() -> Iterator[Any]:
+    """Load the agent_utils_action module as a package, as jivas does."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    base, package = os.path.split(package_dir)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    try:
+        yield cast(
+            Any,
+            Jac.jac_import(target=f"{package}.agent_utils_action", base_path=base)[0],
+        )
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+
+def vector_store_context(descriptor: dict) -> dict:
+    """Return the vector store action's context from a descriptor."""
+    return next(a for a in descriptor["actions"] if a["action"] == VECTOR_STORE)[
+        "context"
+    ]
+
+
+class TestCloneAgent:
+    """Tests for cloning an agent."""
+
+    def test_clone_descriptor(self) -> None:
+        """Identity is stripped and the clone is named by a unique marker, leaving the source untouched."""
+
+        with agent_utils_action() as module:
+            clone = module.clone_descriptor(DESCRIPTOR, "support (clone)")
+
+            assert "id" not in clone
+            assert "descriptor" not in clone
+            assert all("id" not in a["context"] for a in clone["actions"])
+            assert clone["actions"][0]["context"] == {"enabled": True}
+
+            # the marker is the clone's name plus a uuid, which clone_agent renames back to the name
+            match = re.fullmatch(r"(.*) \[([0-9a-f-]{36})\]", clone["name"])
+            assert match and match.group(1) == "support (clone)"
+            assert (
+                module.clone_descriptor(DESCRIPTOR, "support (clone)")["name"]
+                != clone["name"]
+            )
+
+            assert DESCRIPTOR["id"] == "n:Agent:1"
+            assert DESCRIPTOR["name"] == "support"
+            assert DESCRIPTOR["actions"][0]["context"]["id"] == "n:Action:1"
+            assert vector_store_context(DESCRIPTOR)["collection_name"] == "support_kb"
+
+    def test_clone_descriptor_collection_name(self) -> None:
+        """The vector store keeps its collection only when knowledge is copied and shared."""
+
+        with agent_utils_action() as module:
+            for with_knowledge, share_knowledge, kept in [
+                (True, True, True),
+                (True, False, False),
+                (False, True, False),
+                (False, False, False),
+            ]:
+                clone = module.clone_descriptor(
+                    DESCRIPTOR,
+                    "support (clone)",
+                    with_knowledge=with_knowledge,
+                    share_knowledge=share_knowledge,
+                )
+                context = vector_store_context(clone)
+
+                assert ("collection_name" in context) == kept, (
+                    with_knowledge,
+                    share_knowledge,
+                )
+                if kept:
+                    assert context["collection_name"] == "support_kb"
+
+    def test_as_knodes(self) -> None:
+        """Documents become knodes without ids, keeping embeddings when present."""
+
+        with agent_utils_action() as module:
+            documents = [
+                {"id": "1", "text": "a", "metadata": {"source": "x"}, "vec": [0.1]},
+                {"id": "2", "text": "b"},
+            ]
+
+            assert module.as_knodes(documents) == [
+                {"text": "a", "metadata": {"source": "x"}, "vec": [0.1]},
+                {"text": "b", "metadata": {}},
+            ]
@@ -0,0 +1,179 @@
+"""Tests for selecting and purging frame sessions."""
+
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Iterator, cast
+
+
+class StubFrame:
+    """Frame holding interactions as (channel, timestamp) pairs."""
+
+    def __init__(self, session_id: str, *interactions: tuple) -> None:
+        """Hold the interactions."""
+        self.session_id = session_id
+        self.interactions = [
+            SimpleNamespace(channel=channel, timestamp=timestamp)
+            for channel, timestamp in interactions
+        ]
+
+    def get_interactions(self) -> list:
+        """Return the interactions."""
+        return self.interactions
+
+
+class StubMemory:
+    """Memory holding stub frames; records the sessions purged through it."""
+
+    def __init__(self, *frames: StubFrame) -> None:
+        """Hold the frames."""
+        self.frames = list(frames)
+        self.purged: list = []
+
+    def get_frames(self, session_id: str) -> list:
+        """Return every frame."""
+        return self.frames
+
+    def purge_frame_memory(self, session_id: str) -> bool:
+        """Purge a frame by session id."""
+        self.purged.append(session_id)
+        return any(frame.session_id == session_id for frame in self.frames)
+
+
+@contextmanager
+def agent_utils_action(memory: StubMemory) -> Iterator[tuple]:
+    """Load AgentUtilsAction as a package, as jivas does, bound to a stub memory."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    base, package = os.path.split(package_dir)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    try:
+        module = cast(
+            Any,
+            Jac.jac_import(target=f"{package}.agent_utils_action", base_path=base)[0],
+        )
+        action = module.AgentUtilsAction()
+        agent = SimpleNamespace(get_memory=lambda: memory)
+        action.get_agent = lambda: agent
+        yield module, action
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+
+def session_ids(matches: list) -> list:
+    """Return the session ids of matches."""
+    return [match["session_id"] for match in matches]
+
+
+class TestFrameSessions:
+    """Tests for selecting and purging frame sessions."""
+
+    def test_as_utc(self) -> None:
+        """Naive timestamps are taken as UTC; offset timestamps keep their instant."""
+
+        with agent_utils_action(StubMemory()) as (module, _):
+            naive = module.as_utc(datetime(2024, 1, 1, 12, 0))
+            assert naive == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+            assert naive.tzinfo == timezone.utc
+
+            offset = module.as_utc(datetime.fromisoformat("2024-01-01T14:00:00+02:00"))
+            assert offset == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+            assert offset.tzinfo == timezone.utc
+
+    def test_interactions_below(self) -> None:
+        """Only frames with fewer interactions than the threshold match."""
+
+        memory = StubMemory(
+            StubFrame("empty"),
+            StubFrame("one", ("web", "")),
+            StubFrame("two", ("web", ""), ("web", "")),
+        )
+        with agent_utils_action(memory) as (_, action):
+            assert session_ids(action.find_frame_sessions(interactions_below=2)) == [
+                "empty",
+                "one",
+            ]
+            matches = action.find_frame_sessions(session_ids=["two", "one"])
+            assert matches == [
+                {"session_id": "one", "interactions": 1},
+                {"session_id": "two", "interactions": 2},
+            ]
+
+    def test_channel(self) -> None:
+        """Only frames with at least one interaction on the channel match."""
+
+        memory = StubMemory(
+            StubFrame("web", ("web", "")),
+            StubFrame("mixed", ("whatsapp", ""), ("web", "")),
+            StubFrame("whatsapp", ("whatsapp", "")),
+        )
+        with agent_utils_action(memory) as (_, action):
+            assert session_ids(action.find_frame_sessions(channel="web")) == [
+                "web",
+                "mixed",
+            ]
+            assert session_ids(
+                action.find_frame_sessions(channel="web", interactions_below=2)
+            ) == ["web"]
+
+    def test_inactive_before(self) -> None:
+        """Frames match by their latest interaction, comparing naive and offset timestamps as UTC instants."""
+
+        memory = StubMemory(
+            # last active at 11:00 UTC, written with an offset
+            StubFrame(
+                "offset",
+                ("web", "2024-01-01T09:00:00"),
+                ("web", "2024-01-01T13:00:00+02:00"),
+            ),
+            # last active at 12:30 UTC, written naive
+            StubFrame(
+                "naive", ("web", "2024-01-01T10:00:00"), ("web", "2024-01-01T12:30:00")
+            ),
+            # activity can't be determined, so never inactive
+            StubFrame("unknown", ("web", ""), ("web", "not a timestamp")),
+            StubFrame("empty"),
+        )
+        with agent_utils_action(memory) as (_, action):
+            assert session_ids(
+                action.find_frame_sessions(inactive_before="2024-01-01T12:00:00")
+            ) == ["offset"]
+            # the same cutoff expressed in another offset selects the same frames
+            assert session_ids(
+                action.find_frame_sessions(inactive_before="2024-01-01T07:00:00-05:00")
+            ) == ["offset"]
+            assert session_ids(
+                action.find_frame_sessions(inactive_before="2024-01-01T13:00:00+00:00")
+            ) == ["offset", "naive"]
+
+            # a frame last active exactly at the cutoff is not inactive before it
+            cutoff = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+            assert action.find_frame_sessions(inactive_before=cutoff.isoformat()) == []
+            assert session_ids(
+                action.find_frame_sessions(
+                    inactive_before=(cutoff + timedelta(seconds=1)).isoformat()
+                )
+            ) == ["offset"]
+
+    def test_purge_frame_sessions(self) -> None:
+        """Matches are purged through the memory API and only purged sessions are returned."""
+
+        memory = StubMemory(StubFrame("a", ("web", "")), StubFrame("b"))
+        with agent_utils_action(memory) as (_, action):
+            matches = action.find_frame_sessions(session_ids=["a", "b"])
+            matches.append({"session_id": "gone", "interactions": 0})
+
+            assert action.purge_frame_sessions(matches) == ["a", "b"]
+            assert memory.purged == ["a", "b", "gone"]
@@ -0,0 +1,139 @@
+"""Tests for profiling memory."""
+
+import json
+import os
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional, cast
+
+
+class StubNode:
+    """Graph node exporting a fixed dict."""
+
+    def __init__(
+        self, id: str, data: dict, interactions: Optional[list] = None
+    ) -> None:
+        """Hold the export and interactions."""
+        self.id = id
+        self.session_id = data.get("session_id", "")
+        self.data = data
+        self.interactions = interactions or []
+
+    def export(self) -> dict:
+        """Return the export."""
+        return self.data
+
+    def get_interactions(self) -> list:
+        """Return the interactions."""
+        return self.interactions
+
+
+def interaction(id: str, utterance: str, data: dict) -> StubNode:
+    """Return an interaction with an utterance and a data payload."""
+    return StubNode(id, {"utterance": utterance, "data": data})
+
+
+def size(value: Any) -> int:
+    """Return the serialized size profile_memory charges for a value."""
+    return len(json.dumps(value, default=str))
+
+
+@contextmanager
+def agent_utils_action() -> Iterator[Any]:
+    """Load the agent_utils_action module as a package, as jivas does."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    base, package = os.path.split(package_dir)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    try:
+        yield cast(
+            Any,
+            Jac.jac_import(target=f"{package}.agent_utils_action", base_path=base)[0],
+        )
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+
+class TestMemoryProfile:
+    """Tests for profiling memory."""
+
+    def test_top_k(self) -> None:
+        """The heap keeps only the k largest items and returns them largest first, ties included."""
+
+        with agent_utils_action() as module:
+            heap: list = []
+            for n, item_size in enumerate([5, 1, 9, 3, 9, 7, 2]):
+                module.push_top_k(heap, 3, item_size, {"n": n, "bytes": item_size})
+
+            assert len(heap) == 3
+            top = module.sorted_top_k(heap)
+            assert [item["bytes"] for item in top] == [9, 9, 7]
+            assert {item["n"] for item in top[:2]} == {2, 4}
+
+            empty: list = []
+            module.push_top_k(empty, 0, 1, {"bytes": 1})
+            assert module.sorted_top_k(empty) == []
+
+    def test_profile_memory(self) -> None:
+        """Sizes are broken down per data.* field and the largest sessions and interactions are kept."""
+
+        with agent_utils_action() as module:
+            small = interaction("i1", "hi", {"ModelActionResult": ["x"], "tag": 1})
+            large = interaction(
+                "i2", "hello", {"ModelActionResult": ["x" * 100], "tag": 2}
+            )
+            frames = [
+                StubNode("f1", {"session_id": "a"}, [small]),
+                StubNode("f2", {"session_id": "b"}, [small, large]),
+                StubNode("f3", {"session_id": "c"}),
+            ]
+
+            memory = module.Memory()
+            memory.get_frames = lambda session_id: frames
+            agent = SimpleNamespace(get_memory=lambda: memory)
+            action = module.AgentUtilsAction()
+            action.get_agent = lambda: agent
+
+            profile = action.profile_memory(top_k=2)
+
+            assert profile["sessions"] == 3
+            assert profile["interactions"] == 3
+
+            fields = {f["field"]: f for f in profile["fields"]}
+            assert set(fields) == {"utterance", "data.ModelActionResult", "data.tag"}
+            assert fields["data.ModelActionResult"] == {
+                "field": "data.ModelActionResult",
+                "bytes": 2 * size(["x"]) + size(["x" * 100]),
+                "count": 3,
+            }
+            assert fields["data.tag"]["bytes"] == 3
+            assert profile["fields"][0]["field"] == "data.ModelActionResult"
+
+            large_bytes = size("hello") + size(["x" * 100]) + size(2)
+            assert profile["top_interactions"][0] == {
+                "session_id": "b",
+                "interaction_id": "i2",
+                "bytes": large_bytes,
+                "largest_field": "data.ModelActionResult",
+                "largest_field_bytes": size(["x" * 100]),
+            }
+            assert len(profile["top_interactions"]) == 2
+
+            assert [s["session_id"] for s in profile["top_sessions"]] == ["b", "a"]
+            assert profile["top_sessions"][0]["interactions"] == 2
+            # every frame plus every field of every interaction, nothing counted twice
+            assert profile["total_bytes"] == sum(
+                size(frame.export()) for frame in frames
+            ) + sum(f["bytes"] for f in profile["fields"])
+            assert profile["collections"] == []
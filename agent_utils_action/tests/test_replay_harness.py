@@ -0,0 +1,229 @@
+"""Tests for ReplayHarness."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Iterator, cast
+
+INTERACTIONS: list = [
+    {
+        "utterance": "hello",
+        "ModelActionResult": [
+            {
+                "prompt": "say hello",
+                "result": "SAY HELLO",
+                "tokens": 3,
+                "model_name": "gpt-4o",
+                "temperature": 0.2,
+                "max_tokens": 256,
+            }
+        ],
+    },
+    {
+        "utterance": "bye",
+        "ModelActionResult": [
+            {
+                "prompt": "say bye",
+                "result": "goodbye",
+                "tokens": 2,
+                "model_name": "gpt-4o",
+                "temperature": 0.2,
+                "max_tokens": 256,
+            },
+            {"result": "no prompt captured"},
+        ],
+    },
+]
+
+
+def stub_model_action(
+    llm_prompt_message: str,
+    model_name: str,
+    model_temperature: float,
+    model_max_tokens: int,
+) -> dict:
+    """Offline stand-in for a model action's test_invoke."""
+    time.sleep(0.01)
+    return {"result": llm_prompt_message.upper(), "tokens": 5}
+
+
+def stub_model_object(
+    llm_prompt_message: str,
+    model_name: str,
+    model_temperature: float,
+    model_max_tokens: int,
+) -> SimpleNamespace:
+    """Offline stand-in for a model action returning a result object."""
+    return SimpleNamespace(
+        result=llm_prompt_message.upper(), tokens={"total_tokens": 7}
+    )
+
+
+class StubModelAction:
+    """Offline stand-in for a model action, found by its label like any other action."""
+
+    label = "StubModelAction"
+
+    def __init__(self) -> None:
+        """Record the threads test_invoke runs on."""
+        self.threads: set = set()
+
+    def test_invoke(
+        self,
+        llm_prompt_message: str,
+        model_name: str,
+        model_temperature: float,
+        model_max_tokens: int,
+        prompt_messages: list,
+        prompt_variables: dict,
+    ) -> SimpleNamespace:
+        """Return the prompt upper-cased, as a model action result object."""
+        self.threads.add(threading.get_ident())
+        return SimpleNamespace(result=llm_prompt_message.upper(), tokens=5)
+
+
+class StubAgent:
+    """Agent holding a single stub model action; records the threads actions are looked up on."""
+
+    def __init__(self, action: StubModelAction) -> None:
+        """Hold the stub action."""
+        self.action = action
+        self.lookups: list = []
+
+    def get_action(self, action_label: str = "") -> Any:
+        """Return the stub action if the label matches."""
+        self.lookups.append(threading.get_ident())
+        return self.action if action_label == self.action.label else None
+
+
+@contextmanager
+def jac_modules(*names: str) -> Iterator[list]:
+    """Load modules of this action as a package, as jivas does."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    base, package = os.path.split(package_dir)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    try:
+        yield [
+            cast(Any, Jac.jac_import(target=f"{package}.{name}", base_path=base)[0])
+            for name in names
+        ]
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+
+@contextmanager
+def replay_harness() -> Iterator[Any]:
+    """Load ReplayHarness."""
+
+    with jac_modules("replay_harness") as (module,):
+        yield module.ReplayHarness
+
+
+class TestReplayHarness:
+    """Tests for ReplayHarness."""
+
+    def test_replay_harness(self) -> None:
+        """Test ReplayHarness against a stub model action."""
+
+        with replay_harness() as harness_cls:
+            cases = harness_cls.extract_cases(INTERACTIONS)
+            assert [case["prompt"] for case in cases] == ["say hello", "say bye"]
+
+            exported = {
+                "frames": [
+                    {
+                        "interactions": [
+                            {"utterance": i["utterance"], "data": i}
+                            for i in INTERACTIONS
+                        ]
+                    }
+                ]
+            }
+            assert len(harness_cls.extract_cases(exported)) == 2
+
+            harness = harness_cls(
+                invoke=stub_model_action, concurrency=2, rate=100.0, repeat=3
+            )
+            report = harness.run(cases)
+
+            assert report["calls"] == 6
+            assert report["errors"] == 0
+            assert report["tokens"]["total"] == 30
+            assert report["diff"]["unchanged"] == 3
+            assert report["diff"]["changed"] == 3
+            assert 0 < report["latency"]["p50"] <= report["latency"]["p99"]
+            assert report["throughput"] > 0
+
+    def test_object_response(self) -> None:
+        """Test ReplayHarness against a model action returning an object with result and tokens."""
+
+        with replay_harness() as harness_cls:
+            harness = harness_cls(invoke=stub_model_object, concurrency=1)
+            report = harness.run(harness_cls.extract_cases(INTERACTIONS))
+
+            assert report["calls"] == 2
+            assert report["errors"] == 0
+            assert report["tokens"]["total"] == 14
+            assert report["diff"]["unchanged"] == 1
+
+    def test_malformed_cases(self) -> None:
+        """Test that entries which aren't objects are skipped rather than raising."""
+
+        with replay_harness() as harness_cls:
+            assert harness_cls.extract_cases("hello") == []
+            assert harness_cls.extract_cases(["hello", 1]) == []
+            assert harness_cls.extract_cases({"frames": ["hello"]}) == []
+            assert (
+                harness_cls.extract_cases(
+                    [{"ModelActionResult": "hello"}, {"ModelActionResult": ["x"]}]
+                )
+                == []
+            )
+
+    def test_stub_model_action(self) -> None:
+        """Test test_llm_call and a replay against a stub model action selected by model_action_label."""
+
+        with jac_modules("agent_utils_action", "replay_harness") as (
+            module,
+            harness_module,
+        ):
+            stub = StubModelAction()
+            agent = StubAgent(stub)
+            action = module.AgentUtilsAction()
+            action.get_agent = lambda: agent
+
+            result = action.test_llm_call(
+                llm_prompt_message="say hello", model_action_label=stub.label
+            )
+            assert result.result == "SAY HELLO"
+
+            assert action.model_invoke("MissingModelAction") is None
+            assert action.test_llm_call(model_action_label="MissingModelAction") == {}
+
+            # the action is resolved once on this thread; the pool only calls test_invoke
+            agent.lookups.clear()
+            stub.threads.clear()
+            invoke = action.model_invoke(stub.label)
+            harness_cls = harness_module.ReplayHarness
+            harness = harness_cls(invoke=invoke, concurrency=2, repeat=2)
+            report = harness.run(harness_cls.extract_cases(INTERACTIONS))
+
+            assert report["calls"] == 4
+            assert report["errors"] == 0
+            assert report["tokens"]["total"] == 20
+            assert agent.lookups == [threading.get_ident()]
+            assert threading.get_ident() not in stub.threads
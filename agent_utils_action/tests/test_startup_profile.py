@@ -0,0 +1,154 @@
+"""Startup profile for AgentUtilsAction."""
+
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PACKAGE = os.path.basename(BASE)
+
+# dependencies only the operations that need them import, inside the ability body
+DEFERRED = ["yaml", "difflib", "concurrent.futures", f"{PACKAGE}.replay_harness"]
+
+# module-level imports the action is allowed to add on top of the framework; extending this list is a
+# deliberate startup cost that should be justified in review
+EAGER = [
+    "copy",
+    "datetime",
+    "functools",
+    "heapq",
+    "importlib",
+    "itertools",
+    "json",
+    "logging",
+    "math",
+    "operator",
+    "re",
+    "threading",
+    "time",
+    "typing",
+    "uuid",
+]
+
+FRAMEWORK = ["jaclang", "jac_cloud", "jivas", PACKAGE]
+
+
+def lib_modules() -> list:
+    """Return the modules lib.jac loads, in order."""
+
+    with open(os.path.join(BASE, "lib.jac")) as f:
+        match = re.search(
+            r"import\s+from\s+actions\.jivas\.agent_utils_action\s*\{([^}]*)\}",
+            f.read(),
+        )
+    assert match, "lib.jac does not import from actions.jivas.agent_utils_action"
+    return [name.strip() for name in match.group(1).split(",") if name.strip()]
+
+
+def framework_modules() -> list:
+    """Return the jivas and jac_cloud modules the action imports from."""
+
+    modules: set = set()
+    for filename in os.listdir(BASE):
+        if filename.endswith(".jac"):
+            with open(os.path.join(BASE, filename)) as f:
+                modules.update(
+                    re.findall(
+                        r"^import\s+from\s+((?:jivas|jac_cloud)\.[\w.]+)",
+                        f.read(),
+                        re.M,
+                    )
+                )
+    return sorted(modules)
+
+
+def profile_modules(modules: list) -> dict:
+    """Load the framework, then each module in order; return the modules each one newly loaded and its seconds."""
+
+    from jaclang.runtimelib.machine import ExecutionContext
+    from jaclang.runtimelib.machine import JacMachine as Jac
+
+    base = os.path.dirname(BASE)
+
+    os.environ["JACPATH"] = "./"
+
+    Jac.set_base_path(base)
+    jctx = ExecutionContext()
+    Jac.set_context(jctx)
+
+    report = {}
+    try:
+        # the framework is loaded first so only what the action itself pulls in is charged to it
+        for framework_module in framework_modules():
+            importlib.import_module(framework_module)
+
+        for mod in modules:
+            loaded = set(sys.modules)
+            start = time.perf_counter()
+            Jac.jac_import(target=f"{PACKAGE}.{mod}", base_path=base)
+            report[mod] = {
+                "seconds": round(time.perf_counter() - start, 4),
+                "loaded": sorted(set(sys.modules) - loaded),
+            }
+    finally:
+        jctx.close()
+
+        del os.environ["JACPATH"]
+
+    return report
+
+
+class TestStartupProfile:
+    """Startup profile for AgentUtilsAction."""
+
+    def test_startup_profile(self) -> None:
+        """Loading every lib.jac module leaves deferred dependencies unloaded and adds no unlisted imports."""
+
+        # a fresh interpreter so nothing is already cached in sys.modules
+        result = subprocess.run(
+            [sys.executable, __file__],
+            cwd=BASE,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+        modules = json.loads(result.stdout.strip().splitlines()[-1])
+        assert list(modules) == lib_modules()
+
+        # the timing report is informational only; wall-clock times are too noisy to assert on
+        if report_path := os.environ.get("AGENT_UTILS_STARTUP_REPORT"):
+            with open(report_path, "w") as f:
+                json.dump(
+                    {
+                        "modules": {mod: m["seconds"] for mod, m in modules.items()},
+                        "total": round(sum(m["seconds"] for m in modules.values()), 4),
+                    },
+                    f,
+                    indent=2,
+                )
+
+        loaded = {name: mod for mod, m in modules.items() for name in m["loaded"]}
+
+        deferred = {
+            name: mod
+            for name, mod in loaded.items()
+            if any(name == d or name.startswith(f"{d}.") for d in DEFERRED)
+        }
+        assert not deferred, f"deferred dependencies loaded at startup: {deferred}"
+
+        unlisted = {
+            name: mod
+            for name, mod in loaded.items()
+            if name.split(".")[0] not in FRAMEWORK + EAGER
+        }
+        assert not unlisted, f"modules loaded at startup outside EAGER: {unlisted}"
+
+
+if __name__ == "__main__":
+    # run by test_startup_profile in a fresh interpreter; the last line of output is the profile
+    print(json.dumps(profile_modules(lib_modules())))